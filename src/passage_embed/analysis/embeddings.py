@@ -1,10 +1,17 @@
 """Embedding generation module for passage embedding analysis."""
 
+import atexit
+import json
+import os
+from contextlib import nullcontext
+from pathlib import Path
+
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from typing import Dict, List, Any, Tuple, Optional
 from halo import Halo
 
+from ..core.embed_cache import DiskEmbeddingCache
 from ..core.exceptions import EmbeddingError
 from ..core.logging import get_logger
 
@@ -13,6 +20,40 @@ logger = get_logger(__name__)
 
 ALLOWED_MRL_DIMS = {128, 256, 512, 768}
 
+ALLOWED_PRECISIONS = ('float32', 'int8', 'uint8', 'binary', 'ubinary')
+
+# Below this many texts, multi-process pool startup costs more than it saves
+MULTI_PROCESS_THRESHOLD = 512
+
+# Loaded models keyed by model name; loading dominates short runs, so
+# generators created for the same model within a process share one instance
+_MODEL_CACHE: Dict[str, SentenceTransformer] = {}
+
+
+def _inference_ctx():
+    """Context manager disabling autograd bookkeeping around a forward pass.
+
+    torch.inference_mode is slightly cheaper than no_grad; falls back to a
+    no-op when torch is unavailable or too old.
+    """
+    try:
+        import torch
+        return torch.inference_mode()
+    except Exception:
+        return nullcontext()
+
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embeddings along the last axis.
+
+    Normalizing once at encode time lets every downstream cosine similarity
+    collapse to a plain dot product, skipping two norm reductions and a
+    divide per comparison. Zero vectors are left untouched.
+    """
+    array = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    return np.divide(array, norms, out=array.copy(), where=norms > 0)
+
 
 class EmbeddingGenerator:
     """Generator for text embeddings using sentence transformers."""
@@ -21,22 +62,64 @@ class EmbeddingGenerator:
         self,
         model_name: str = 'google/embeddinggemma-300m',
         embedding_dim: int = 768,
+        precision: str = 'float32',
+        cache_dir: Optional[str] = None,
+        output_dtype: Optional[str] = None,
+        pool_workers: Optional[int] = None,
     ):
         """Initialize embedding generator.
 
         Args:
             model_name: Name of the sentence transformer model to use.
             embedding_dim: Target embedding dimension when supported (Matryoshka truncation).
+            precision: Storage precision for generate_embeddings output. Quantized
+                precisions (int8/uint8/binary/ubinary) shrink memory bandwidth and
+                storage; consumers should upcast to float32 for exact rescoring.
+            cache_dir: Optional directory for an on-disk embedding cache; warm
+                runs then skip the forward pass for previously seen texts.
+            output_dtype: Optional floating dtype (e.g. 'float16') that
+                generate_embeddings output is cast to. Half precision is
+                lossless for similarity ranking of normalized vectors and
+                halves downstream memory traffic. Ignored when a quantized
+                precision is set.
+            pool_workers: Number of CPU worker processes for multi-process
+                encoding of large batches; defaults to sentence-transformers'
+                own device-based choice.
         """
         self.model_name = model_name
         self.embedding_dim = embedding_dim
+        self.precision = precision
+        self.output_dtype = np.dtype(output_dtype) if output_dtype is not None else None
+        self._cache: Optional[DiskEmbeddingCache] = None
+        if cache_dir is not None:
+            self._cache = DiskEmbeddingCache(cache_dir, model_name, embedding_dim)
         self.model: Optional[SentenceTransformer] = None
         self.is_gemma = 'embeddinggemma' in self.model_name.lower()
+        self.pool_workers = pool_workers
+        self._pool = None
+        self._pool_unavailable = False
+        # In-process memo for query vectors; query lists overlap heavily
+        # across successive runs in the same session
+        self._query_memo: Dict[str, np.ndarray] = {}
         self._validate_embedding_dim()
+        self._validate_precision()
+        # embedding_dim never changes after construction, so pick the
+        # truncation path once instead of re-checking per call
+        self._truncate = (
+            (lambda embeddings: embeddings)
+            if self.embedding_dim is None
+            else self._apply_truncation
+        )
         self._load_model()
     
     def _load_model(self):
-        """Load the sentence transformer model."""
+        """Load the sentence transformer model, reusing any cached instance."""
+        cached = _MODEL_CACHE.get(self.model_name)
+        if cached is not None:
+            self.model = cached
+            return
+
+        self._configure_cpu_threads()
         try:
             with Halo(text=f"Loading SentenceTransformer model: {self.model_name}", spinner="dots") as spinner:
                 if self.is_gemma:
@@ -48,16 +131,93 @@ class EmbeddingGenerator:
                         ) from import_error
 
                     target_dtype = torch.bfloat16 if hasattr(torch, 'bfloat16') else torch.float32
-                    self.model = SentenceTransformer(
-                        self.model_name,
+                    self.model = self._construct_model(
                         model_kwargs={'torch_dtype': target_dtype},
                     )
                 else:
-                    self.model = SentenceTransformer(self.model_name)
+                    self.model = self._construct_model()
+                self._maybe_move_to_gpu()
+                _MODEL_CACHE[self.model_name] = self.model
                 spinner.succeed(f"Model {self.model_name} loaded successfully")
         except Exception as e:
             raise EmbeddingError(f"Failed to load model {self.model_name}: {e}")
 
+    def _construct_model(self, **kwargs) -> SentenceTransformer:
+        """Instantiate the SentenceTransformer, trying the local cache first.
+
+        local_files_only skips the HuggingFace hub HTTP resolution entirely
+        when the artifacts are already on disk — the common case for every
+        run after the first; a cache miss raises OSError and falls back to
+        the normal download path.
+        """
+        try:
+            return SentenceTransformer(self.model_name, local_files_only=True, **kwargs)
+        except OSError:
+            logger.debug(f"Model {self.model_name} not cached locally; downloading")
+            return SentenceTransformer(self.model_name, **kwargs)
+
+    def _configure_cpu_threads(self) -> None:
+        """Align PyTorch and BLAS thread counts with the available cores.
+
+        Mismatched torch intra-op and OpenMP/MKL pools oversubscribe
+        many-core hosts and slow inference; pin them all to one coherent
+        value. Environment variables the user already exported win, and the
+        interop setting can only be applied before torch runs its first op,
+        hence the broad guard.
+        """
+        threads = max(1, os.cpu_count() or 1)
+        os.environ.setdefault('OMP_NUM_THREADS', str(threads))
+        os.environ.setdefault('MKL_NUM_THREADS', str(threads))
+        try:
+            import torch
+            torch.set_num_threads(threads)
+            torch.set_num_interop_threads(1)
+        except Exception as e:
+            logger.debug(f"Thread configuration skipped: {e}")
+
+    def _maybe_move_to_gpu(self) -> None:
+        """Move the model to CUDA and halve precision when a GPU is available.
+
+        FP16 halves the bytes moved per encode pass and roughly doubles
+        matmul throughput on tensor cores. EmbeddingGemma already loads in
+        bfloat16, so only the device move applies there. No-op when torch or
+        CUDA is unavailable.
+        """
+        try:
+            import torch
+            if not torch.cuda.is_available():
+                return
+            self.model = self.model.to('cuda')
+            if not self.is_gemma:
+                self.model = self.model.half()
+            self._maybe_compile(torch)
+        except Exception as e:
+            logger.debug(f"GPU placement skipped: {e}")
+
+    def _maybe_compile(self, torch) -> None:
+        """Best-effort torch.compile and flash-attention setup on CUDA.
+
+        Compilation fuses the encoder forward into fewer kernels and SDPA
+        picks flash-attention paths; both are pure wins when they work and
+        safely skipped on older torch builds or unsupported models.
+
+        The compile targets the wrapped HF transformer rather than the
+        SentenceTransformer: every encode path goes through model.encode,
+        which invokes the inner auto_model, so compiling the outer module
+        would produce a graph nothing ever calls.
+        """
+        try:
+            torch.backends.cuda.enable_flash_sdp(True)
+        except Exception as e:
+            logger.debug(f"Flash SDPA not enabled: {e}")
+        try:
+            transformer = self.model._first_module()
+            transformer.auto_model = torch.compile(
+                transformer.auto_model, mode='reduce-overhead', dynamic=True
+            )
+        except Exception as e:
+            logger.debug(f"torch.compile skipped: {e}")
+
     def _validate_embedding_dim(self) -> None:
         """Validate embedding dimension constraints."""
         if self.embedding_dim is None:
@@ -70,23 +230,37 @@ class EmbeddingGenerator:
             raise EmbeddingError(
                 f"EmbeddingGemma supports embedding dimensions {sorted(ALLOWED_MRL_DIMS)}, received {self.embedding_dim}."
             )
+
+    def _validate_precision(self) -> None:
+        """Validate the requested storage precision."""
+        if self.precision not in ALLOWED_PRECISIONS:
+            raise EmbeddingError(
+                f"precision must be one of {ALLOWED_PRECISIONS}, received {self.precision!r}"
+            )
     
     def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for a list of texts.
         
         Args:
             texts: List of text strings to embed
-            
+
         Returns:
-            Array of embeddings
+            Array of L2-normalized embeddings; cosine similarity between rows
+            is a plain dot product
         """
         if self.model is None:
             raise EmbeddingError("Model not loaded")
         
         try:
             with Halo(text=f"Generating embeddings for {len(texts)} texts", spinner="dots") as spinner:
-                embeddings = self.model.encode(texts)
-                embeddings = self._apply_truncation(embeddings)
+                # Encode each distinct text once and fan the rows back out;
+                # boilerplate (nav links, repeated alt text) often duplicates
+                unique_texts, inverse = np.unique(
+                    np.asarray(texts, dtype=object), return_inverse=True
+                )
+                embeddings = self._encode_bulk(list(unique_texts))
+                embeddings = self._truncate(embeddings)[inverse]
+                embeddings = self._apply_precision(embeddings)
                 spinner.succeed(f"Generated embeddings for {len(texts)} texts")
             return embeddings
         except Exception as e:
@@ -111,29 +285,74 @@ class EmbeddingGenerator:
         if self.model is None:
             raise EmbeddingError("Model not loaded")
             
+        # Flatten every source's elements into one batch so the encoder runs
+        # once for the whole document set instead of once per source.
+        # Malformed elements are logged and skipped, not allowed to fail the
+        # whole batch
+        flat_elements = []
         for url_key, elements in json_data.items():
-            element_embeddings = []
-            
             for element in elements:
-                try:
-                    embedding = self._encode_document(element["value"])
-                    embedding = self._apply_truncation(embedding)
-                    embeddings_data.append({
-                        'embedding': embedding,
-                        'label': url_key,
-                        'type': element["type"],
-                        'value': element["value"],
-                        'symbol': symbol_mapping.get(element["source"], "circle"),
-                        'size': size_mapping.get(element["source"], 8)
-                    })
-                    element_embeddings.append(embedding)
-                except Exception as e:
-                    logger.warning(f"Failed to embed element: {element['value'][:50]}... Error: {e}")
+                if (
+                    not isinstance(element, dict)
+                    or 'value' not in element
+                    or 'type' not in element
+                    or 'source' not in element
+                ):
+                    logger.warning(
+                        f"Failed to embed element: {str(element)[:50]}... Error: missing value/type/source"
+                    )
                     continue
-            
-            # Compute mean embedding for each top-level key
-            if element_embeddings:
-                top_level_embeddings[url_key] = np.mean(element_embeddings, axis=0)
+                flat_elements.append((url_key, element))
+        all_texts = [element["value"] for _, element in flat_elements]
+        # One spinner around the single batched encode — its redraw thread
+        # wakes every ~80ms, so it stays out of the per-element paths
+        with Halo(text=f"Generating embeddings for {len(all_texts)} elements", spinner="dots") as spinner:
+            all_embeddings = self._encode_document_batch(all_texts, 'all sources')
+            spinner.succeed(f"Generated embeddings for {len(all_texts)} elements")
+
+        kept = [
+            (url_key, element, embedding)
+            for (url_key, element), embedding in zip(flat_elements, all_embeddings)
+            if embedding is not None
+        ]
+
+        # Copy the surviving embeddings into one contiguous float32 matrix and
+        # hand out row views, so downstream code that restacks or reduces the
+        # embeddings reads a single block of memory instead of N scattered
+        # per-element arrays
+        width = len(kept[0][2]) if kept else 0
+        embedding_matrix = np.empty((len(kept), width), dtype=np.float32)
+        grouped_rows: Dict[str, List[int]] = {}
+        # Elements repeat the same handful of sources, so resolve each
+        # source's symbol/size pair once instead of two dict gets per row
+        style_by_source: Dict[str, Tuple[str, int]] = {}
+        for i, (url_key, element, embedding) in enumerate(kept):
+            embedding_matrix[i] = embedding
+            source = element["source"]
+            style = style_by_source.get(source)
+            if style is None:
+                style = style_by_source[source] = (
+                    symbol_mapping.get(source, "circle"),
+                    size_mapping.get(source, 8),
+                )
+            embeddings_data.append({
+                'embedding': embedding_matrix[i],
+                'label': url_key,
+                'type': element["type"],
+                'value': element["value"],
+                'symbol': style[0],
+                'size': style[1]
+            })
+            grouped_rows.setdefault(url_key, []).append(i)
+
+        # The flatten keeps each source's rows contiguous, so every per-source
+        # mean comes out of one np.add.reduceat pass over the matrix at the
+        # group start offsets instead of a fancy-indexed mean per key
+        if kept:
+            sizes = np.array([len(rows) for rows in grouped_rows.values()])
+            offsets = np.concatenate(([0], np.cumsum(sizes[:-1])))
+            means = np.add.reduceat(embedding_matrix, offsets, axis=0) / sizes[:, None]
+            top_level_embeddings = dict(zip(grouped_rows, means))
         
         logger.info(f"Processed {len(embeddings_data)} embeddings from {len(json_data)} sources")
         return embeddings_data, top_level_embeddings
@@ -152,8 +371,7 @@ class EmbeddingGenerator:
             
         try:
             with Halo(text=f"Generating embeddings for {len(queries)} queries", spinner="dots") as spinner:
-                query_embeddings = self._encode_queries(queries)
-                query_embeddings = self._apply_truncation(query_embeddings)
+                query_embeddings = self._encode_query_batch(queries)
                 spinner.succeed(f"Generated query embeddings")
             
             query_embeddings_data = [
@@ -175,17 +393,197 @@ class EmbeddingGenerator:
         except Exception as e:
             raise EmbeddingError(f"Failed to generate query embeddings: {e}")
 
+    def _encode_query_batch(self, queries: List[str]) -> np.ndarray:
+        """Encode queries with truncation applied, consulting the caches.
+
+        Query sets are typically stable across runs, so hits in the
+        in-process memo (or the disk cache when enabled) skip the forward
+        pass entirely. Cached under a separate 'query' kind because
+        asymmetric models embed the same text differently per kind.
+
+        Args:
+            queries: Query strings to encode
+
+        Returns:
+            2D array of embeddings aligned with the input queries
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        embeddings_by_text: Dict[str, np.ndarray] = {}
+        for query in unique_queries:
+            memoized = self._query_memo.get(query)
+            if memoized is not None:
+                embeddings_by_text[query] = memoized
+            elif self._cache is not None:
+                cached = self._cache.get('query', query)
+                if cached is not None:
+                    embeddings_by_text[query] = cached
+                    self._query_memo[query] = cached
+
+        missing = [query for query in unique_queries if query not in embeddings_by_text]
+        if missing:
+            encoded = np.atleast_2d(self._truncate(self._encode_queries(missing)))
+            for query, embedding in zip(missing, encoded):
+                embeddings_by_text[query] = embedding
+                self._query_memo[query] = embedding
+                if self._cache is not None:
+                    self._cache.put('query', query, embedding)
+
+        return np.stack([embeddings_by_text[query] for query in queries])
+
+    def _encode_document_batch(self, texts: List[str], label: str) -> List[Optional[np.ndarray]]:
+        """Encode element texts in a single batched call.
+
+        Batching amortizes tokenization and forward-pass overhead across all
+        elements instead of paying it once per element. Falls back to
+        per-element encoding if the batched call fails.
+
+        Args:
+            texts: Element texts to encode
+            label: Batch description, used for log messages
+
+        Returns:
+            List of embeddings aligned with texts; failed elements are None
+        """
+        if texts:
+            try:
+                # Encode each distinct text once; boilerplate (nav links,
+                # repeated alt text) often duplicates across a page
+                unique_texts = list(dict.fromkeys(texts))
+
+                embeddings_by_text: Dict[str, np.ndarray] = {}
+                if self._cache is not None:
+                    for text in unique_texts:
+                        cached = self._cache.get('document', text)
+                        if cached is not None:
+                            embeddings_by_text[text] = cached
+
+                missing = [text for text in unique_texts if text not in embeddings_by_text]
+                if missing:
+                    encoded = self._truncate(self._encode_documents(missing))
+                    for text, embedding in zip(missing, encoded):
+                        embeddings_by_text[text] = embedding
+                        if self._cache is not None:
+                            self._cache.put('document', text, embedding)
+
+                return [embeddings_by_text[text] for text in texts]
+            except Exception as e:
+                logger.warning(f"Batch encoding failed for {label}, falling back to per-element encoding: {e}")
+
+        results: List[Optional[np.ndarray]] = []
+        for text in texts:
+            try:
+                embedding = self._encode_document(text)
+                results.append(self._truncate(embedding))
+            except Exception as e:
+                logger.warning(f"Failed to embed element: {text[:50]}... Error: {e}")
+                results.append(None)
+        return results
+
+    def _encode_documents(self, texts: List[str]) -> np.ndarray:
+        """Encode a batch of documents using the appropriate model method.
+
+        Gemma models are deliberately kept on the in-process path: their
+        encode_document applies a document prompt that encode_multi_process
+        (which only calls plain encode) would drop, silently changing the
+        embeddings. Everything else routes through _encode_bulk so large
+        CPU-only batches can fan out to the worker pool.
+        """
+        if self.model is None:
+            raise EmbeddingError("Model not loaded")
+
+        if self.is_gemma and hasattr(self.model, 'encode_document'):
+            return self._encode_length_sorted(texts, self.model.encode_document)
+        return self._encode_bulk(texts)
+
+    def _encode_bulk(self, texts: List[str]) -> np.ndarray:
+        """Encode a text list, fanning out to a multi-process pool when worthwhile.
+
+        On CPU-only hosts with large inputs, sentence-transformers' worker
+        pool parallelizes the forward pass across physical cores; small jobs
+        stay on the in-process length-sorted path to avoid pool startup cost.
+        """
+        if self._should_use_pool(len(texts)):
+            pool = self._ensure_pool()
+            if pool is not None:
+                embeddings = self.model.encode_multi_process(texts, pool)
+                return _l2_normalize(np.atleast_2d(np.asarray(embeddings)))
+
+        return self._encode_length_sorted(texts, self.model.encode)
+
+    def _should_use_pool(self, n_texts: int) -> bool:
+        """Decide whether multi-process encoding would pay off."""
+        if n_texts <= MULTI_PROCESS_THRESHOLD or self._pool_unavailable:
+            return False
+        if not hasattr(self.model, 'start_multi_process_pool'):
+            return False
+        try:
+            import torch
+            if torch.cuda.is_available():
+                # A single GPU beats CPU worker processes for this workload
+                return False
+        except Exception:
+            pass
+        return True
+
+    def _ensure_pool(self):
+        """Start the multi-process encoding pool on first use.
+
+        Sized by the pool_workers constructor argument when given, otherwise
+        by sentence-transformers' own device-based choice. The worker
+        processes outlive individual encode calls, so the first start
+        registers close() to run at interpreter exit.
+        """
+        if self._pool is None:
+            try:
+                target_devices = ['cpu'] * self.pool_workers if self.pool_workers else None
+                self._pool = self.model.start_multi_process_pool(target_devices=target_devices)
+                atexit.register(self.close)
+            except Exception as e:
+                logger.warning(f"Could not start multi-process encoding pool: {e}")
+                self._pool_unavailable = True
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the multi-process encoding pool if one was started."""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+
+    def _encode_length_sorted(self, texts: List[str], encode_fn) -> np.ndarray:
+        """Encode texts sorted by length, restoring the original order afterwards.
+
+        The tokenizer pads each mini-batch to its longest member, so encoding
+        length-sorted inputs minimizes wasted padding compute. The returned
+        rows are permuted back to match the input order.
+
+        Args:
+            texts: Texts to encode
+            encode_fn: Model method used to encode the sorted list
+
+        Returns:
+            2D array of embeddings aligned with the input texts
+        """
+        order = np.argsort([len(text) for text in texts], kind='stable')
+        sorted_texts = [texts[i] for i in order]
+        with _inference_ctx():
+            embeddings = np.atleast_2d(np.asarray(encode_fn(sorted_texts)))
+
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        return _l2_normalize(embeddings[inverse])
+
     def _encode_document(self, text: str) -> np.ndarray:
         """Encode a document using the appropriate model method."""
         if self.model is None:
             raise EmbeddingError("Model not loaded")
 
-        if self.is_gemma and hasattr(self.model, 'encode_document'):
-            embeddings = self.model.encode_document([text])
-        else:
-            embeddings = self.model.encode([text])
+        with _inference_ctx():
+            if self.is_gemma and hasattr(self.model, 'encode_document'):
+                embeddings = self.model.encode_document([text])
+            else:
+                embeddings = self.model.encode([text])
 
-        array = np.asarray(embeddings)
+        array = _l2_normalize(np.asarray(embeddings))
         if array.ndim == 1:
             return array
         return array[0]
@@ -196,25 +594,47 @@ class EmbeddingGenerator:
             raise EmbeddingError("Model not loaded")
 
         if self.is_gemma and hasattr(self.model, 'encode_query'):
-            return np.asarray(self.model.encode_query(queries))
+            return self._encode_length_sorted(queries, self.model.encode_query)
 
-        return np.asarray(self.model.encode(queries))
+        return self._encode_length_sorted(queries, self.model.encode)
 
     def _apply_truncation(self, embeddings: np.ndarray) -> np.ndarray:
-        """Apply Matryoshka truncation when requested."""
-        if self.embedding_dim is None:
-            return embeddings
-
+        """Apply Matryoshka truncation; reached only when a dim is configured."""
         array = np.asarray(embeddings)
 
         if array.ndim == 1:
             return self._truncate_embedding(array)
 
         if array.ndim == 2:
-            return np.array([self._truncate_embedding(vec) for vec in array])
+            if array.shape[-1] <= self.embedding_dim:
+                return array
+            # Slice then renormalize all rows with two broadcast ops instead
+            # of a Python loop allocating one small array per row
+            truncated = np.ascontiguousarray(array[:, :self.embedding_dim])
+            norms = np.linalg.norm(truncated, axis=1, keepdims=True)
+            np.divide(truncated, norms, out=truncated, where=norms > 0)
+            return truncated
 
         return array
 
+    def _apply_precision(self, embeddings: np.ndarray) -> np.ndarray:
+        """Quantize embeddings to the configured storage precision.
+
+        int8/uint8 cut memory bandwidth 4x versus float32 on the similarity
+        dot kernels; binary precisions go further for pure retrieval. The
+        visualization pipeline keeps float32 internally, so quantization only
+        applies to the storage-facing generate_embeddings output.
+        """
+        if self.precision == 'float32':
+            if self.output_dtype is not None:
+                return np.asarray(embeddings).astype(self.output_dtype, copy=False)
+            return embeddings
+
+        from sentence_transformers.quantization import quantize_embeddings
+
+        array = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        return quantize_embeddings(array, precision=self.precision)
+
     def _truncate_embedding(self, embedding: np.ndarray) -> np.ndarray:
         """Truncate an embedding vector and renormalize it."""
         vector = np.asarray(embedding)
@@ -229,20 +649,74 @@ class EmbeddingGenerator:
         return truncated
 
 
+def save_embeddings_data(embeddings_data: List[Dict[str, Any]], base_path: str) -> Tuple[Path, Path]:
+    """Persist embeddings as one .npy matrix plus a JSON metadata sidecar.
+
+    A single (N, d) float32 file can be memory-mapped on load and feeds BLAS
+    bulk operations directly, unlike a pickle of N small per-row arrays.
+
+    Args:
+        embeddings_data: Embedding rows from process_json_data
+        base_path: Output path without extension; .npy and .json are appended
+
+    Returns:
+        Tuple of (matrix path, metadata path)
+    """
+    matrix = np.stack([row['embedding'] for row in embeddings_data]).astype(
+        np.float32, copy=False
+    )
+    npy_path = Path(f"{base_path}.npy")
+    meta_path = Path(f"{base_path}.json")
+
+    np.save(npy_path, matrix)
+    metadata = [
+        {key: value for key, value in row.items() if key != 'embedding'}
+        for row in embeddings_data
+    ]
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False)
+
+    return npy_path, meta_path
+
+
+def load_embeddings_data(base_path: str, mmap: bool = True) -> List[Dict[str, Any]]:
+    """Load embeddings saved by save_embeddings_data.
+
+    Args:
+        base_path: Path prefix used when saving (without extension)
+        mmap: Memory-map the matrix so rows page in lazily instead of
+            reading the whole file up front
+
+    Returns:
+        Embedding rows in process_json_data's list-of-dicts shape, each
+        holding a view into the shared matrix
+    """
+    matrix = np.load(f"{base_path}.npy", mmap_mode='r' if mmap else None)
+    with open(f"{base_path}.json", 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+
+    return [
+        dict(row, embedding=matrix[i])
+        for i, row in enumerate(metadata)
+    ]
+
+
 def generate_embeddings(
     texts: List[str],
     model_name: str = 'google/embeddinggemma-300m',
     embedding_dim: int = 768,
+    precision: str = 'float32',
 ) -> np.ndarray:
     """Convenience function to generate embeddings.
-    
+
     Args:
         texts: List of text strings to embed
         model_name: Name of the sentence transformer model
         embedding_dim: Target embedding dimension when supported
-        
+        precision: Storage precision for the returned embeddings
+
     Returns:
         Array of embeddings
     """
-    generator = EmbeddingGenerator(model_name, embedding_dim)
+    generator = EmbeddingGenerator(model_name, embedding_dim, precision=precision)
     return generator.generate_embeddings(texts)
\ No newline at end of file
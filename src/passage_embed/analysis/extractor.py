@@ -1,12 +1,30 @@
 """HTML content extraction module for passage embedding analysis."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 import os
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json remains the fallback
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:  # html.parser is slower but always available
+    _BS_PARSER = 'html.parser'
+
+# Every tag the single extraction traversal looks at; meta and img get
+# extra attribute checks during dispatch
+_EXTRACTED_TAGS = [
+    'title', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'meta', 'img', 'dt', 'dd'
+]
+
 from ..core.exceptions import FileError
 from ..core.logging import get_logger
 from ..utils.versioning import VersionManager
@@ -27,74 +45,65 @@ class HTMLExtractor:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.version_manager = VersionManager(output_dir)
     
-    def extract_from_html(self, html_content: str, source_name: str) -> List[Dict[str, Any]]:
+    def extract_from_html(self, html_content: Union[str, bytes], source_name: str) -> List[Dict[str, Any]]:
         """Extract SEO-relevant content from HTML.
-        
+
         Args:
-            html_content: HTML content as string
+            html_content: HTML content as string or raw bytes
             source_name: Name/source of the HTML content
             
         Returns:
             List of extracted content items
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _BS_PARSER)
         extracted_data = []
-        
-        # Extract headings and meta tags
-        for tag in ['title', 'meta[name="description"]', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            elements = soup.select(tag)
-            for element in elements:
-                if tag == 'meta[name="description"]':
-                    text_value = element.attrs.get('content', '')
-                else:
-                    text_value = element.get_text(strip=True)
-                
+
+        # One DOM traversal collects every element kind, dispatching on the
+        # tag name; the per-kind select/find_all calls each re-walked the
+        # full tree. Elements now come out in document order.
+        for element in soup.find_all(_EXTRACTED_TAGS):
+            name = element.name
+
+            if name == 'meta':
+                if element.attrs.get('name') != 'description':
+                    continue
+                text_value = element.attrs.get('content', '')
                 if text_value:
                     extracted_data.append({
-                        'type': tag.replace('meta[name="description"]', 'meta description'),
+                        'type': 'meta description',
                         'value': text_value,
                         'source': source_name
                     })
-        
-        # Extract images inside <picture> tags
-        for img in soup.select('picture img'):
-            src = img.get('src')
-            alt = img.get('alt')
-            
-            if src:
-                filename = os.path.basename(urlparse(src).path)
-                extracted_data.append({
-                    'type': 'img src',
-                    'value': filename,
-                    'source': source_name
-                })
-            
-            if alt:
-                extracted_data.append({
-                    'type': 'img alt',
-                    'value': alt,
-                    'source': source_name
-                })
-        
-        # Extract <dt> and <dd> tags
-        for dt in soup.find_all('dt'):
-            text = dt.get_text(strip=True)
-            if text:
-                extracted_data.append({
-                    'type': 'dt',
-                    'value': text,
-                    'source': source_name
-                })
-        
-        for dd in soup.find_all('dd'):
-            text = dd.get_text(strip=True)
-            if text:
+                continue
+
+            if name == 'img':
+                # Only images wrapped in <picture> are SEO-relevant here
+                if element.find_parent('picture') is None:
+                    continue
+                src = element.get('src')
+                alt = element.get('alt')
+                if src:
+                    extracted_data.append({
+                        'type': 'img src',
+                        'value': os.path.basename(urlparse(src).path),
+                        'source': source_name
+                    })
+                if alt:
+                    extracted_data.append({
+                        'type': 'img alt',
+                        'value': alt,
+                        'source': source_name
+                    })
+                continue
+
+            text_value = element.get_text(strip=True)
+            if text_value:
                 extracted_data.append({
-                    'type': 'dd',
-                    'value': text,
+                    'type': name,
+                    'value': text_value,
                     'source': source_name
                 })
-        
+
         logger.info(f"Extracted {len(extracted_data)} elements from {source_name}")
         return extracted_data
     
@@ -109,8 +118,11 @@ class HTMLExtractor:
             List of extracted content items
         """
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # The scraper decodes responses and persists UTF-8 text, so the
+            # file must be read as UTF-8 here: handing raw bytes to the
+            # parser would let a stale <meta charset> declaration (e.g.
+            # iso-8859-1) mis-decode the re-encoded content
+            html_content = Path(html_file).read_text(encoding='utf-8')
             return self.extract_from_html(html_content, source_name)
         except Exception as e:
             raise FileError(f"Failed to read HTML file {html_file}: {e}")
@@ -128,13 +140,40 @@ class HTMLExtractor:
         # Get versioned filename
         json_path = self.version_manager.get_versioned_path(base_name, '.json')
         
-        # Save data
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # Save data; orjson writes UTF-8 bytes directly and is much faster
+        # than the stdlib's indent formatting when available
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                ))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
         
         logger.info(f"Saved extracted data to: {json_path}")
         return json_path
     
+    def load_extracted_data(self, json_path: Path) -> Dict[str, List[Dict[str, Any]]]:
+        """Load previously extracted data from a JSON file.
+
+        Args:
+            json_path: Path to a JSON file written by save_extracted_data
+
+        Returns:
+            Dictionary mapping sources to extracted data
+        """
+        try:
+            # orjson parses UTF-8 bytes in C, several times faster than the
+            # stdlib for the multi-MB files large scrapes produce
+            if orjson is not None:
+                return orjson.loads(Path(json_path).read_bytes())
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            raise FileError(f"Failed to load extracted data from {json_path}: {e}")
+
     def extract_multiple_files(self, html_files: Dict[str, Path]) -> Dict[str, List[Dict[str, Any]]]:
         """Extract content from multiple HTML files.
         
@@ -145,15 +184,24 @@ class HTMLExtractor:
             Dictionary mapping roles to extracted data
         """
         results = {}
-        
-        for role, html_file in html_files.items():
-            try:
-                extracted_data = self.extract_from_file(html_file, role)
-                results[role] = extracted_data
-            except Exception as e:
-                logger.error(f"Failed to extract from {role} file: {e}")
-                raise
-        
+
+        if not html_files:
+            return results
+
+        # Files are independent, so parse them concurrently; lxml releases
+        # the GIL while parsing, as does the file I/O
+        with ThreadPoolExecutor(max_workers=min(4, len(html_files))) as executor:
+            futures = {
+                role: executor.submit(self.extract_from_file, html_file, role)
+                for role, html_file in html_files.items()
+            }
+            for role, future in futures.items():
+                try:
+                    results[role] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to extract from {role} file: {e}")
+                    raise
+
         return results
 
 
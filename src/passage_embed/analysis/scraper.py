@@ -1,8 +1,10 @@
 """Web scraping module for passage embedding analysis."""
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from halo import Halo
@@ -32,6 +34,18 @@ class WebScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36'
         }
+
+        # One pooled session for all fetches: connections (TCP + TLS) are
+        # reused across URLs and transient failures retry with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def scrape_url(self, url: str, role: str) -> Path:
         """Scrape a single URL and save the HTML.
@@ -51,29 +65,32 @@ class WebScraper:
             logger.info(f"Scraping URL: {url}")
             
             with Halo(text=f"Downloading {role} HTML", spinner="dots") as spinner:
-                response = requests.get(url, headers=self.headers, timeout=30)
+                response = self.session.get(url, timeout=30, stream=True)
                 response.raise_for_status()
                 spinner.succeed(f"Downloaded {role} HTML")
-            
+
             # Create filename from URL
             from urllib.parse import urlparse
             from slugify import slugify
-            
+
             parsed = urlparse(url)
             domain = parsed.netloc.replace('www.', '')
             path = parsed.path.strip('/')
-            
+
             if path:
                 base_name = f"{role}-{domain}-{slugify(path)}"
             else:
                 base_name = f"{role}-{domain}"
-            
+
             # Get versioned filename
             html_path = self.version_manager.get_versioned_path(base_name, '.html')
-            
-            # Save HTML
+
+            # Stream the body to disk in decoded chunks instead of buffering
+            # the whole page in memory twice (raw bytes plus decoded text)
+            response.encoding = response.encoding or 'utf-8'
             with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+                for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+                    f.write(chunk)
             
             logger.info(f"Saved HTML to: {html_path}")
             return html_path
@@ -93,17 +110,25 @@ class WebScraper:
             Dictionary mapping roles to file paths
         """
         results = {}
-        
-        for role, url in urls.items():
-            if url is None:
-                continue
-            try:
-                html_path = self.scrape_url(url, role)
-                results[role] = html_path
-            except Exception as e:
-                logger.error(f"Failed to scrape {role} URL: {e}")
-                raise
-        
+        pending = {role: url for role, url in urls.items() if url is not None}
+
+        if not pending:
+            return results
+
+        # Fetches are network-bound, so run them concurrently; wall time
+        # approaches the slowest fetch instead of the sum of all fetches
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            futures = {
+                role: executor.submit(self.scrape_url, url, role)
+                for role, url in pending.items()
+            }
+            for role, future in futures.items():
+                try:
+                    results[role] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to scrape {role} URL: {e}")
+                    raise
+
         return results
     
     def get_html_content(self, file_path: Path) -> str:
@@ -1,13 +1,31 @@
 """Configuration management for passage embedding analysis."""
 
+import copy
+import functools
 import os
+import sys
 import yaml
 from pathlib import Path
+
+try:
+    # libyaml's C tokenizer parses and emits roughly an order of magnitude
+    # faster than the pure-Python default
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
+# Slotted dataclasses drop the per-instance __dict__ (less memory, faster
+# attribute access); the slots option needs Python 3.10 and older
+# interpreters keep the default layout
+if sys.version_info >= (3, 10):
+    _config_dataclass = functools.partial(dataclass, slots=True)
+else:
+    _config_dataclass = dataclass
+
 
-@dataclass
+@_config_dataclass
 class ScrapingConfig:
     """Configuration for web scraping."""
     user_agents: list[str] = field(default_factory=lambda: [
@@ -21,7 +39,7 @@ class ScrapingConfig:
     rate_limit_delay: float = 1.0
 
 
-@dataclass
+@_config_dataclass
 class EmbeddingConfig:
     """Configuration for embedding generation."""
     model_name: str = 'google/embeddinggemma-300m'
@@ -29,9 +47,10 @@ class EmbeddingConfig:
     batch_size: int = 32
     max_length: int = 512
     cache_dir: str = '.cache/embeddings'
+    precision: str = 'float32'
 
 
-@dataclass
+@_config_dataclass
 class VisualizationConfig:
     """Configuration for visualization."""
     plot_height: int = 600
@@ -42,7 +61,7 @@ class VisualizationConfig:
     comparison_color: str = '#2ca02c'
 
 
-@dataclass
+@_config_dataclass
 class Config:
     """Main configuration class."""
     
@@ -86,13 +105,30 @@ class Config:
             config = cls()
             config.save_to_file(config_path)
             return config
-        
-        with open(config_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
-        
+
+        # The mtime key invalidates the memo automatically when the file is
+        # edited; repeated loads in one process skip the YAML parse entirely.
+        # Hand out a copy so callers own their instance — mutating a loaded
+        # config must not contaminate later loads of the same file
+        return copy.deepcopy(_load_config_cached(
+            str(config_file.resolve()), config_file.stat().st_mtime_ns, interactive
+        ))
+
+    @classmethod
+    def _parse_file(cls, config_file: Path, interactive: bool) -> 'Config':
+        """Parse and validate a config file that is known to exist."""
+        # Hand the binary file object straight to the loader: the parser
+        # streams from it (no full-file f.read() buffer) and decodes UTF-8
+        # itself, skipping the TextIOWrapper layer
+        with open(config_file, 'rb') as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        if not interactive:
+            return cls._apply_non_interactive(data)
+
         # Create default config first
         config = cls()
-        
+
         # Reconstruct nested dataclasses from dict data
         if 'scraping' in data and isinstance(data['scraping'], dict):
             try:
@@ -102,69 +138,90 @@ class Config:
                     raise ValueError(f"scraping.timeout must be a positive integer, got {config.scraping.timeout}")
             except (TypeError, ValueError) as e:
                 error_msg = f"Invalid scraping config: {e}"
-                if interactive:
-                    response = input(f"⚠️  Warning: {error_msg}\nProceed with default scraping config? [y/n]: ")
-                    if response.lower() != 'y':
-                        raise ValueError(f"Config loading cancelled: {error_msg}")
-                    # Use default scraping config
-                    config.scraping = ScrapingConfig()
-                else:
-                    raise ValueError(error_msg)
+                response = input(f"⚠️  Warning: {error_msg}\nProceed with default scraping config? [y/n]: ")
+                if response.lower() != 'y':
+                    raise ValueError(f"Config loading cancelled: {error_msg}")
+                # Use default scraping config
+                config.scraping = ScrapingConfig()
         
         if 'embedding' in data and isinstance(data['embedding'], dict):
             try:
                 config.embedding = EmbeddingConfig(**data['embedding'])
             except (TypeError, ValueError) as e:
                 error_msg = f"Invalid embedding config: {e}"
-                if interactive:
-                    response = input(f"⚠️  Warning: {error_msg}\nProceed with default embedding config? [y/n]: ")
-                    if response.lower() != 'y':
-                        raise ValueError(f"Config loading cancelled: {error_msg}")
-                    # Use default embedding config
-                    config.embedding = EmbeddingConfig()
-                else:
-                    raise ValueError(error_msg)
+                response = input(f"⚠️  Warning: {error_msg}\nProceed with default embedding config? [y/n]: ")
+                if response.lower() != 'y':
+                    raise ValueError(f"Config loading cancelled: {error_msg}")
+                # Use default embedding config
+                config.embedding = EmbeddingConfig()
         
         if 'visualization' in data and isinstance(data['visualization'], dict):
             try:
                 config.visualization = VisualizationConfig(**data['visualization'])
             except (TypeError, ValueError) as e:
                 error_msg = f"Invalid visualization config: {e}"
-                if interactive:
-                    response = input(f"⚠️  Warning: {error_msg}\nProceed with default visualization config? [y/n]: ")
-                    if response.lower() != 'y':
-                        raise ValueError(f"Config loading cancelled: {error_msg}")
-                    # Use default visualization config
-                    config.visualization = VisualizationConfig()
-                else:
-                    raise ValueError(error_msg)
+                response = input(f"⚠️  Warning: {error_msg}\nProceed with default visualization config? [y/n]: ")
+                if response.lower() != 'y':
+                    raise ValueError(f"Config loading cancelled: {error_msg}")
+                # Use default visualization config
+                config.visualization = VisualizationConfig()
         
         # Update top-level fields (allow partial overrides)
         for key in ['output_dir', 'test_output_dir', 'log_dir', 'cache_dir', 'log_level', 'log_format']:
             if key in data:
-                try:
-                    setattr(config, key, data[key])
-                except (TypeError, ValueError) as e:
-                    error_msg = f"Invalid value for {key}: {e}"
-                    if interactive:
-                        response = input(f"⚠️  Warning: {error_msg}\nProceed with default value? [y/n]: ")
-                        if response.lower() != 'y':
-                            raise ValueError(f"Config loading cancelled: {error_msg}")
-                    else:
-                        raise ValueError(error_msg)
+                setattr(config, key, data[key])
         
         # Validate the final configuration
         try:
             config.validate()
         except ValueError as e:
             error_msg = f"Configuration validation failed: {e}"
-            if interactive:
-                response = input(f"⚠️  Warning: {error_msg}\nProceed anyway? [y/n]: ")
-                if response.lower() != 'y':
-                    raise ValueError(f"Config loading cancelled: {error_msg}")
-            else:
-                raise ValueError(error_msg)
-        
+            response = input(f"⚠️  Warning: {error_msg}\nProceed anyway? [y/n]: ")
+            if response.lower() != 'y':
+                raise ValueError(f"Config loading cancelled: {error_msg}")
+
+        return config
+
+    @classmethod
+    def _apply_non_interactive(cls, data: Dict[str, Any]) -> 'Config':
+        """Build a Config from parsed YAML, raising on the first problem.
+
+        The fast path for non-interactive callers: one try/except per
+        sub-config instead of prompt scaffolding around every field, and
+        plain setattr for the top-level overrides, which cannot raise on a
+        dataclass field.
+        """
+        config = cls()
+
+        if 'scraping' in data and isinstance(data['scraping'], dict):
+            try:
+                config.scraping = ScrapingConfig(**data['scraping'])
+                if not isinstance(config.scraping.timeout, int) or config.scraping.timeout <= 0:
+                    raise ValueError(f"scraping.timeout must be a positive integer, got {config.scraping.timeout}")
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid scraping config: {e}")
+
+        if 'embedding' in data and isinstance(data['embedding'], dict):
+            try:
+                config.embedding = EmbeddingConfig(**data['embedding'])
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid embedding config: {e}")
+
+        if 'visualization' in data and isinstance(data['visualization'], dict):
+            try:
+                config.visualization = VisualizationConfig(**data['visualization'])
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid visualization config: {e}")
+
+        for key in ('output_dir', 'test_output_dir', 'log_dir', 'cache_dir', 'log_level', 'log_format'):
+            if key in data:
+                setattr(config, key, data[key])
+
+        try:
+            config.validate()
+        except ValueError as e:
+            raise ValueError(f"Configuration validation failed: {e}")
+
         return config
     
     def save_to_file(self, config_path: str = 'config.yaml') -> None:
@@ -192,7 +249,8 @@ class Config:
                 'embedding_dim': self.embedding.embedding_dim,
                 'batch_size': self.embedding.batch_size,
                 'max_length': self.embedding.max_length,
-                'cache_dir': self.embedding.cache_dir
+                'cache_dir': self.embedding.cache_dir,
+                'precision': self.embedding.precision
             },
             'visualization': {
                 'plot_height': self.visualization.plot_height,
@@ -205,7 +263,7 @@ class Config:
         }
         
         with open(config_file, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(config_dict, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
     
     def get_from_env(self, key: str, default: Any = None) -> Any:
         """Get configuration value from environment variable."""
@@ -221,4 +279,10 @@ class Config:
             raise ValueError("embedding.batch_size must be a positive integer")
         
         if self.log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-            raise ValueError("log_level must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL") 
\ No newline at end of file
+            raise ValueError("log_level must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, interactive: bool) -> Config:
+    """Memoized file parse; failed loads raise and are never cached."""
+    return Config._parse_file(Path(path), interactive)
\ No newline at end of file
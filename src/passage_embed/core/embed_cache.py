@@ -0,0 +1,87 @@
+"""On-disk embedding cache for passage embedding analysis."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class DiskEmbeddingCache:
+    """Content-addressed cache mapping texts to embedding vectors on disk.
+
+    Each entry is a small .npy file named by the SHA-256 of the model name,
+    embedding dimension, encoding kind and text, so re-running an analysis
+    over unchanged content replaces transformer forward passes with a hash
+    lookup and a file read. Each writer stages into its own uniquely-named
+    temp file and renames it into place, so concurrent runs never observe a
+    partial entry and last-writer-wins on the rename.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, embedding_dim: Optional[int]):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached embeddings
+            model_name: Model identifier baked into every cache key
+            embedding_dim: Target embedding dimension baked into every key
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        self.embedding_dim = embedding_dim
+
+    def get(self, kind: str, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for a text, or None on a miss.
+
+        Args:
+            kind: Encoding kind ('document' or 'query'); kept separate because
+                asymmetric models embed the same text differently per kind
+            text: The text that was embedded
+        """
+        path = self._entry_path(kind, text)
+        if not path.exists():
+            return None
+        try:
+            return np.load(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            return None
+
+    def put(self, kind: str, text: str, embedding: np.ndarray) -> None:
+        """Store an embedding for a text.
+
+        Args:
+            kind: Encoding kind ('document' or 'query')
+            text: The text that was embedded
+            embedding: The embedding vector to cache
+        """
+        path = self._entry_path(kind, text)
+        tmp_path = None
+        try:
+            # A unique temp name per writer keeps concurrent puts of the same
+            # key from interleaving into one file; the rename is atomic
+            fd, tmp_name = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asarray(embedding))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def _entry_path(self, kind: str, text: str) -> Path:
+        """Compute the on-disk path for a cache entry."""
+        payload = f"{self.model_name}\x00{self.embedding_dim}\x00{kind}\x00{text}"
+        digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.npy"
@@ -3,6 +3,7 @@
 import logging
 import logging.handlers
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -24,26 +25,36 @@ def setup_logging(
         max_bytes: Maximum size of log file before rotation
         backup_count: Number of backup log files to keep
     """
+    # Re-running with an unchanged configuration would only churn file
+    # descriptors re-opening the same three handlers; the fingerprint
+    # includes the date so the daily log file still rolls over at midnight
+    key = (log_dir, log_level, log_format, max_bytes, backup_count,
+           datetime.now().date())
+    if getattr(setup_logging, '_installed', None) == key:
+        return
+
     # Create log directory
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
-    
+
+    level = getattr(logging, log_level.upper())
+
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
-    
+    root_logger.setLevel(level)
+
     # Clear existing handlers
     root_logger.handlers.clear()
-    
+
     # Create formatter
     formatter = logging.Formatter(log_format)
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
-    
+
     # File handler with rotation
     log_file = log_path / f'passage_embed_{datetime.now().strftime("%Y%m%d")}.log'
     file_handler = logging.handlers.RotatingFileHandler(
@@ -51,7 +62,7 @@ def setup_logging(
         maxBytes=max_bytes,
         backupCount=backup_count
     )
-    file_handler.setLevel(getattr(logging, log_level.upper()))
+    file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
     
@@ -66,6 +77,8 @@ def setup_logging(
     error_handler.setFormatter(formatter)
     root_logger.addHandler(error_handler)
 
+    setup_logging._installed = key
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
@@ -95,18 +108,20 @@ class PerformanceLogger:
     
     def __enter__(self):
         """Start timing the operation."""
-        self.start_time = datetime.now()
+        # Monotonic integer clock: no object allocation per call, immune to
+        # wall-clock jumps, and cheap enough for log_function_call wrappers
+        self.start_time = time.perf_counter_ns()
         self.logger.info(f"Starting {self.operation}")
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and log the duration."""
         if self.start_time:
-            duration = datetime.now() - self.start_time
+            duration_s = (time.perf_counter_ns() - self.start_time) / 1e9
             if exc_type is None:
-                self.logger.info(f"Completed {self.operation} in {duration.total_seconds():.2f}s")
+                self.logger.info(f"Completed {self.operation} in {duration_s:.2f}s")
             else:
-                self.logger.error(f"Failed {self.operation} after {duration.total_seconds():.2f}s: {exc_val}")
+                self.logger.error(f"Failed {self.operation} after {duration_s:.2f}s: {exc_val}")
 
 
 def log_function_call(func):
@@ -1,5 +1,6 @@
 """Output directory management utilities for passage embedding analysis."""
 
+import os
 from pathlib import Path
 from typing import Optional
 from ..core.config import Config
@@ -57,6 +58,86 @@ def create_test_run_directory(config: Optional[Config] = None, run_name: Optiona
     return test_run_dir
 
 
+def consolidate_scattered_outputs(source_dirs, config: Optional[Config] = None) -> int:
+    """Move stray output files from scattered directories into the output dir.
+
+    Uses os.replace — a single atomic rename(2) syscall — for the common
+    same-filesystem case, falling back to shutil.move only for cross-device
+    moves where a copy is unavoidable.
+
+    Args:
+        source_dirs: Iterable of directories to sweep for output files
+        config: Configuration object. If None, loads default config.
+
+    Returns:
+        Number of files moved
+    """
+    import shutil
+
+    if config is None:
+        config = Config.load_from_file()
+
+    target_dir = Path(config.output_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    moved = 0
+    for source_dir in source_dirs:
+        source = Path(source_dir)
+        if not source.is_dir() or source.resolve() == target_dir.resolve():
+            continue
+
+        with os.scandir(source) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                destination = target_dir / entry.name
+                try:
+                    os.replace(entry.path, destination)
+                except OSError:
+                    shutil.move(entry.path, str(destination))
+                moved += 1
+
+    return moved
+
+
+def show_output_structure(config: Optional[Config] = None) -> None:
+    """Print the output directory tree with per-file sizes.
+
+    Walks the tree with os.scandir so entry type and size come from the
+    cached DirEntry data instead of a second stat() per path, and sorts
+    entries per directory instead of materializing one globally sorted list.
+
+    Args:
+        config: Configuration object. If None, loads default config.
+    """
+    if config is None:
+        config = Config.load_from_file()
+
+    outputs_dir = Path(config.output_dir)
+    if not outputs_dir.exists():
+        print(f"Output directory does not exist: {outputs_dir}")
+        return
+
+    print(f"{outputs_dir}/")
+    _print_directory_tree(outputs_dir, depth=1)
+
+
+def _print_directory_tree(directory: Path, depth: int) -> None:
+    """Recursively print one directory level from cached scandir entries."""
+    indent = '    ' * depth
+
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            print(f"{indent}{entry.name}/")
+            _print_directory_tree(Path(entry.path), depth + 1)
+        else:
+            size = entry.stat(follow_symlinks=False).st_size
+            print(f"{indent}{entry.name} ({size:,} bytes)")
+
+
 def cleanup_old_test_runs(config: Optional[Config] = None, keep_days: int = 7) -> None:
     """Clean up old test run directories.
     
@@ -64,31 +145,32 @@ def cleanup_old_test_runs(config: Optional[Config] = None, keep_days: int = 7) -
         config: Configuration object. If None, loads default config.
         keep_days: Number of days to keep test runs
     """
+    import shutil
     from datetime import datetime, timedelta
-    
+
     if config is None:
         config = Config.load_from_file()
-    
+
     base_test_dir = Path(config.test_output_dir)
     if not base_test_dir.exists():
         return
-    
-    cutoff_date = datetime.now() - timedelta(days=keep_days)
-    
-    for test_dir in base_test_dir.iterdir():
-        if test_dir.is_dir():
-            # Try to parse directory name for date
-            try:
-                # Assume format: test_run_YYYYMMDD_HHMMSS
-                dir_name = test_dir.name
-                if dir_name.startswith("test_run_"):
-                    date_str = dir_name.split("_")[2]  # Get YYYYMMDD part
-                    dir_date = datetime.strptime(date_str, "%Y%m%d")
-                    
-                    if dir_date < cutoff_date:
-                        import shutil
-                        shutil.rmtree(test_dir)
-                        print(f"Cleaned up old test run: {test_dir}")
-            except (ValueError, IndexError):
-                # If we can't parse the date, skip this directory
-                continue 
\ No newline at end of file
+
+    # Directory names embed dates as fixed-width YYYYMMDD, so one
+    # lexicographic compare against the precomputed cutoff string replaces a
+    # strptime parse (and datetime allocation) per entry
+    cutoff_str = (datetime.now() - timedelta(days=keep_days)).strftime("%Y%m%d")
+
+    # scandir answers is_dir from the cached dirent data, skipping the
+    # per-entry stat() that iterdir + Path.is_dir would pay
+    with os.scandir(base_test_dir) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            # Assume format: test_run_YYYYMMDD_HHMMSS
+            dir_name = entry.name
+            if not dir_name.startswith("test_run_"):
+                continue
+            date_str = dir_name[9:17]  # Get YYYYMMDD part
+            if len(date_str) == 8 and date_str.isdigit() and date_str < cutoff_str:
+                shutil.rmtree(entry.path)
+                print(f"Cleaned up old test run: {entry.path}") 
\ No newline at end of file
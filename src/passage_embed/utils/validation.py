@@ -1,5 +1,6 @@
 """Validation utilities for passage embedding analysis."""
 
+import functools
 import re
 from pathlib import Path
 from typing import List, Union
@@ -7,27 +8,54 @@ from urllib.parse import urlparse
 
 from ..core.exceptions import ValidationError
 
+# Hoisted out of the validators so the hot path does a hashed set lookup
+# against prebuilt constants instead of rebuilding tuples per call
+_VALID_ROLES = frozenset(('client', 'competitor', 'comparison'))
+_VALID_LOG_LEVELS = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
 
-def validate_url(url: str) -> str:
+
+def validate_url(url: str, strict: bool = False) -> str:
     """Validate and normalize a URL.
-    
+
     Args:
         url: URL string to validate
-        
+        strict: Run the full urlparse validation instead of the cheap
+            netloc check; the fast path accepts everything urlparse would
+
     Returns:
         Normalized URL string
-        
+
     Raises:
         ValidationError: If URL is invalid
     """
     if not url:
         raise ValidationError("URL cannot be empty")
-    
+
     # Add protocol if missing
-    if not url.startswith(('http://', 'https://')):
+    if not _SCHEME_RE.match(url):
         url = 'https://' + url
-    
-    # Basic URL validation
+
+    if not strict:
+        # The netloc ends at the first '/', '?' or '#', exactly as urlparse
+        # splits it; slicing it out here avoids the SplitResult allocation
+        # urlparse pays per call while rejecting the same inputs (e.g.
+        # 'https://?q=1' has an empty netloc either way)
+        rest = url.partition('://')[2]
+        end = len(rest)
+        for sep in ('/', '?', '#'):
+            idx = rest.find(sep, 0, end)
+            if idx != -1:
+                end = idx
+        if end == 0:
+            raise ValidationError(f"Invalid URL: {url}")
+        netloc = rest[:end]
+        # Bracketed (IPv6-literal) netlocs have validity rules of their own
+        # — urlparse rejects unbalanced brackets — so hand those to the full
+        # parse below instead of duplicating them here
+        if '[' not in netloc and ']' not in netloc:
+            return url
+
     try:
         result = urlparse(url)
         if not result.netloc:
@@ -37,8 +65,12 @@ def validate_url(url: str) -> str:
         raise ValidationError(f"Invalid URL format: {url} - {e}")
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_domain_name(url: str) -> str:
     """Extract a clean domain name from a URL for display purposes.
+
+    Results are memoized: the same client/competitor URLs are resolved
+    repeatedly during label rewrites, so each distinct URL is parsed once.
     
     Args:
         url: URL string
@@ -78,22 +110,34 @@ def validate_queries(queries_str: str) -> List[str]:
     """
     if not queries_str:
         raise ValidationError("Queries cannot be empty")
-    
-    queries = [q.strip() for q in queries_str.split(',') if q.strip()]
-    
+
+    # One pass strips, filters and length-checks each entry; the first
+    # length violation is deferred so the emptiness and count errors keep
+    # their precedence over per-query errors
+    queries: List[str] = []
+    append = queries.append
+    bad = None
+    for raw in queries_str.split(','):
+        query = raw.strip()
+        if not query:
+            continue
+        if bad is None:
+            if len(query) < 2:
+                bad = (len(queries), 'short', query)
+            elif len(query) > 200:
+                bad = (len(queries), 'long', query)
+        append(query)
+
     if not queries:
         raise ValidationError("No valid queries found")
-    
+
     if len(queries) > 50:
         raise ValidationError("Too many queries (maximum 50)")
-    
-    # Validate individual queries
-    for i, query in enumerate(queries):
-        if len(query) < 2:
-            raise ValidationError(f"Query {i+1} too short: '{query}'")
-        if len(query) > 200:
-            raise ValidationError(f"Query {i+1} too long: '{query}'")
-    
+
+    if bad is not None:
+        i, kind, query = bad
+        raise ValidationError(f"Query {i+1} too {kind}: '{query}'")
+
     return queries
 
 
@@ -109,15 +153,13 @@ def validate_role(role: str) -> str:
     Raises:
         ValidationError: If role is invalid
     """
-    valid_roles = ['client', 'competitor', 'comparison']
-    
     if not role:
         raise ValidationError("Role cannot be empty")
-    
+
     role = role.lower().strip()
-    
-    if role not in valid_roles:
-        raise ValidationError(f"Invalid role: {role}. Must be one of: {valid_roles}")
+
+    if role not in _VALID_ROLES:
+        raise ValidationError(f"Invalid role: {role}. Must be one of: {sorted(_VALID_ROLES)}")
     
     return role
 
@@ -172,6 +214,5 @@ def validate_config_values(config: dict) -> None:
     
     # Validate logging config
     if 'log_level' in config:
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if config['log_level'] not in valid_levels:
-            raise ValidationError(f"log_level must be one of: {valid_levels}") 
\ No newline at end of file
+        if config['log_level'] not in _VALID_LOG_LEVELS:
+            raise ValidationError(f"log_level must be one of: {sorted(_VALID_LOG_LEVELS)}")
\ No newline at end of file
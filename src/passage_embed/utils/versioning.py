@@ -17,26 +17,36 @@ class VersionManager:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    def _iter_versions(self, base_name: str, extension: str):
+        """Yield (version, path) pairs for existing versions of a file.
+
+        One directory listing with a regex compiled per call (base_name and
+        extension are escaped, so names containing regex metacharacters
+        match literally) shared by every versioning method.
+        """
+        pattern = re.compile(
+            re.escape(base_name) + r'-v(\d+)' + re.escape(extension) + '$'
+        )
+        for file_path in self.output_dir.glob(f"{base_name}-v*{extension}"):
+            match = pattern.match(file_path.name)
+            if match:
+                yield int(match.group(1)), file_path
+
     def get_next_version(self, base_name: str, extension: str) -> int:
         """Get the next version number for a file.
-        
+
         Args:
             base_name: Base name of the file (without version)
             extension: File extension (including dot)
-            
+
         Returns:
             Next version number
         """
-        pattern = f"{base_name}-v(\\d+){extension}"
-        existing_versions = []
-        
-        for file_path in self.output_dir.glob(f"{base_name}-v*{extension}"):
-            match = re.match(pattern, file_path.name)
-            if match:
-                existing_versions.append(int(match.group(1)))
-        
-        return max(existing_versions, default=0) + 1
+        return max(
+            (version for version, _ in self._iter_versions(base_name, extension)),
+            default=0,
+        ) + 1
     
     def get_versioned_filename(self, base_name: str, extension: str) -> str:
         """Get the next versioned filename.
@@ -72,15 +82,8 @@ class VersionManager:
             extension: File extension (including dot)
             keep_versions: Number of recent versions to keep
         """
-        pattern = f"{base_name}-v(\\d+){extension}"
-        files_with_versions = []
-        
-        for file_path in self.output_dir.glob(f"{base_name}-v*{extension}"):
-            match = re.match(pattern, file_path.name)
-            if match:
-                version = int(match.group(1))
-                files_with_versions.append((version, file_path))
-        
+        files_with_versions = list(self._iter_versions(base_name, extension))
+
         # Sort by version number and keep only the most recent
         files_with_versions.sort(key=lambda x: x[0], reverse=True)
         
@@ -97,18 +100,14 @@ class VersionManager:
         Returns:
             Path to the latest version, or None if no versions exist
         """
-        pattern = f"{base_name}-v(\\d+){extension}"
         latest_version = None
         latest_number = -1
-        
-        for file_path in self.output_dir.glob(f"{base_name}-v*{extension}"):
-            match = re.match(pattern, file_path.name)
-            if match:
-                version = int(match.group(1))
-                if version > latest_number:
-                    latest_number = version
-                    latest_version = file_path
-        
+
+        for version, file_path in self._iter_versions(base_name, extension):
+            if version > latest_number:
+                latest_number = version
+                latest_version = file_path
+
         return latest_version
 
 
@@ -6,7 +6,6 @@ from openTSNE import TSNE
 from sklearn.decomposition import PCA
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.metrics.pairwise import cosine_similarity
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import os
@@ -22,6 +21,58 @@ MIN_SAMPLES_FOR_TSNE = 4
 DEFAULT_PERPLEXITY = 30
 
 
+def _fit_tsne(embeddings: np.ndarray, perplexity: int) -> np.ndarray:
+    """Reduce embeddings to 3D with t-SNE, preferring the CUDA backend.
+
+    tsnecuda runs Barnes-Hut/FFT t-SNE entirely on the GPU with large
+    speedups on big point counts; openTSNE remains the CPU fallback when it
+    is not installed.
+
+    Args:
+        embeddings: Input embedding matrix
+        perplexity: t-SNE perplexity
+
+    Returns:
+        Array of shape (n_samples, 3)
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    try:
+        from tsnecuda import TSNE as CudaTSNE
+        return np.asarray(
+            CudaTSNE(n_components=3, perplexity=perplexity, random_seed=42).fit_transform(embeddings)
+        )
+    except ImportError:
+        pass
+
+    tsne = TSNE(n_components=3, perplexity=perplexity, random_state=42)
+    return np.asarray(tsne.fit(embeddings))
+
+
+def _mean_similarities(
+    mean_embeddings: Dict[str, np.ndarray], queries_mean: np.ndarray
+) -> Dict[str, float]:
+    """Cosine similarity of each source mean against the query mean.
+
+    Stacks the K means into one (K, d) float32 matrix, normalizes the rows
+    and the query vector once, and reduces everything with a single
+    matrix-vector product instead of K scalar similarity calls.
+    """
+    if not mean_embeddings:
+        return {}
+
+    keys = list(mean_embeddings)
+    matrix = np.stack([mean_embeddings[key] for key in keys]).astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+    query = np.asarray(queries_mean, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    if query_norm > 0:
+        query = query / query_norm
+
+    return dict(zip(keys, (matrix @ query).tolist()))
+
+
 def create_3d_visualization(
     embeddings_data: List[Dict[str, Any]],
     mean_embeddings: Dict[str, np.ndarray],
@@ -47,8 +98,13 @@ def create_3d_visualization(
     try:
         # Step 1: Reduce dimensions with t-SNE or PCA fallback
         logger.info("Reducing dimensions for visualization...")
-        all_embeddings = np.array([data['embedding'] for data in embeddings_data])
-        n_samples = len(all_embeddings)
+        # Fill one preallocated float32 matrix instead of stacking a
+        # temporary list of per-row arrays; halves peak memory for large runs
+        n_samples = len(embeddings_data)
+        embedding_dim = len(embeddings_data[0]['embedding']) if embeddings_data else 0
+        all_embeddings = np.empty((n_samples, embedding_dim), dtype=np.float32)
+        for i, data in enumerate(embeddings_data):
+            all_embeddings[i] = data['embedding']
         
         # Check if we have enough data for t-SNE
         if n_samples < MIN_SAMPLES_FOR_TSNE:
@@ -74,8 +130,7 @@ def create_3d_visualization(
             
             try:
                 logger.info(f"Using t-SNE with perplexity={perplexity} (n_samples={n_samples})")
-                tsne = TSNE(n_components=3, perplexity=perplexity, random_state=42)
-                reduced_embeddings = tsne.fit_transform(all_embeddings)
+                reduced_embeddings = _fit_tsne(all_embeddings, perplexity)
                 reduction_method = "t-SNE"
             except Exception as e:
                 logger.warning(
@@ -93,29 +148,37 @@ def create_3d_visualization(
                 reduction_method = "PCA"
         
         logger.info(f"Dimension reduction completed using {reduction_method}")
-        
-        # Add coordinates to data
-        for i, data in enumerate(embeddings_data):
-            data['x'], data['y'], data['z'] = reduced_embeddings[i]
-        
+
+        # Plotly serializes numpy columns as base64 typed arrays, so keeping
+        # the coordinates at float32 halves the per-point payload the PCA
+        # path would otherwise emit at float64. (float16 would halve it
+        # again but plotly's JSON engine rejects that dtype.)
+        reduced_embeddings = reduced_embeddings.astype(np.float32, copy=False)
+
         # Step 2: Calculate means in t-SNE space (correct approach)
-        df = pd.DataFrame(embeddings_data)
-        tsne_means = {}
-        
-        # Calculate mean for each unique label in t-SNE space
-        for label in df['label'].unique():
-            label_data = df[df['label'] == label]
-            tsne_means[label] = np.array([
-                label_data['x'].mean(),
-                label_data['y'].mean(),
-                label_data['z'].mean()
-            ])
+        # The raw vectors already live in all_embeddings; keeping them as an
+        # object column would bloat the frame and slow every pandas op below
+        df = pd.DataFrame(embeddings_data).drop(columns=['embedding'])
+        # Low-cardinality string columns become categoricals: repeated labels
+        # shrink to integer codes and Plotly's groupby/unique dispatch works
+        # on those codes. Categories keep appearance order so the downstream
+        # position-based color fallback is unaffected.
+        for col in ('label', 'symbol', 'type'):
+            df[col] = pd.Categorical(df[col], categories=pd.unique(df[col]))
+        # Insert the reduced coordinates as three contiguous float columns in
+        # one shot instead of a per-row dict-write loop over N elements
+        df[['x', 'y', 'z']] = reduced_embeddings
+
+        # Calculate mean for each unique label in t-SNE space with a single
+        # vectorized groupby instead of one full-frame filter per label
+        grouped_means = df.groupby('label', sort=False)[['x', 'y', 'z']].mean()
+        tsne_means = {
+            label: row.to_numpy()
+            for label, row in grouped_means.iterrows()
+        }
         
         # Step 3: Calculate cosine similarities (still use original embeddings for accuracy)
-        cosine_similarities = {
-            key: cosine_similarity([mean], [queries_mean])[0][0] 
-            for key, mean in mean_embeddings.items()
-        }
+        cosine_similarities = _mean_similarities(mean_embeddings, queries_mean)
         
         # Step 4: Create DataFrame (already created above)
         
@@ -174,8 +237,14 @@ def create_3d_visualization(
             'Queries': '#2ca02c',  # Green
         }
         
-        # Add mean points and arrows for each group using t-SNE means
-        for label, tsne_mean in tsne_means.items():
+        # Determine color/symbol per group, then emit every mean point in a
+        # single trace; one trace per mean duplicates coordinate arrays in
+        # the serialized HTML and slows browser rendering
+        ordered_labels = list(tsne_means.keys())
+        label_colors = {}
+        mean_symbols = []
+        mean_texts = []
+        for position, label in enumerate(ordered_labels):
             # Determine color based on label - use same color as queries for consistency
             if label == 'Queries':
                 mean_color = query_color  # Use same color as queries points
@@ -188,32 +257,55 @@ def create_3d_visualization(
                 mean_symbol = 'diamond'
             else:
                 # Default to blue for first, orange for second based on order
-                mean_color = color_mapping['client'] if list(tsne_means.keys()).index(label) == 0 else color_mapping['competitor']
+                mean_color = color_mapping['client'] if position == 0 else color_mapping['competitor']
                 mean_symbol = 'diamond'
-            
-            # Add mean point
-            fig.add_trace(
-                go.Scatter3d(
-                    x=[tsne_mean[0]], y=[tsne_mean[1]], z=[tsne_mean[2]],
-                    mode='markers',
-                    marker=dict(size=15, symbol=mean_symbol, color=mean_color),
-                    name=f'Mean: {label}',
-                    showlegend=True
-                )
+
+            label_colors[label] = mean_color
+            mean_symbols.append(mean_symbol)
+            mean_texts.append(f'Mean: {label}')
+
+        mean_coords = np.array([tsne_means[label] for label in ordered_labels])
+        fig.add_trace(
+            go.Scatter3d(
+                x=mean_coords[:, 0], y=mean_coords[:, 1], z=mean_coords[:, 2],
+                mode='markers',
+                marker=dict(
+                    size=15,
+                    symbol=mean_symbols,
+                    color=[label_colors[label] for label in ordered_labels],
+                ),
+                text=mean_texts,
+                hovertext=mean_texts,
+                name='Group means',
+                showlegend=True
             )
-            
-            # Add arrows from each mean to queries mean (if not queries itself)
-            if label != 'Queries' and 'Queries' in tsne_means:
-                queries_tsne_mean = tsne_means['Queries']
+        )
+
+        # Add arrows from each mean to queries mean, merging segments that
+        # share a color into one None-separated line trace; a trace per arrow
+        # serializes a separate JSON object and slows browser rendering
+        if 'Queries' in tsne_means:
+            queries_tsne_mean = tsne_means['Queries']
+            arrows_by_color: Dict[str, Dict[str, list]] = {}
+            for label, tsne_mean in tsne_means.items():
+                if label == 'Queries':
+                    continue
+                group = arrows_by_color.setdefault(
+                    label_colors[label], {'x': [], 'y': [], 'z': [], 'labels': []}
+                )
+                group['x'].extend([tsne_mean[0], queries_tsne_mean[0], None])
+                group['y'].extend([tsne_mean[1], queries_tsne_mean[1], None])
+                group['z'].extend([tsne_mean[2], queries_tsne_mean[2], None])
+                group['labels'].append(label)
+
+            for color, group in arrows_by_color.items():
                 fig.add_trace(
                     go.Scatter3d(
-                        x=[tsne_mean[0], queries_tsne_mean[0]],
-                        y=[tsne_mean[1], queries_tsne_mean[1]],
-                        z=[tsne_mean[2], queries_tsne_mean[2]],
+                        x=group['x'], y=group['y'], z=group['z'],
                         mode='lines+markers',
-                        line=dict(color=mean_color, width=3, dash='dot'),
+                        line=dict(color=color, width=3, dash='dot'),
                         marker=dict(size=2),
-                        name=f'{label} → Queries',
+                        name=f"{', '.join(group['labels'])} → Queries",
                         showlegend=True
                     )
                 )
@@ -287,13 +379,13 @@ def create_3d_visualization(
                 <div class="visualization">
                     <h2>📊 3D Content Embedding Visualization</h2>
                     <p>Interactive 3D plot showing how client and competitor content aligns with target queries.</p>
-                    {fig.to_html(full_html=False, include_plotlyjs=True)}
+                    {fig.to_html(full_html=False, include_plotlyjs='cdn', validate=False, config={'responsive': True})}
                 </div>
                 
                 <div class="similarity-scores">
                     <h2>📈 Similarity Scores</h2>
                     <p>Cosine similarity scores between content and query intent (higher is better):</p>
-                    {similarity_fig.to_html(full_html=False, include_plotlyjs=False)}
+                    {similarity_fig.to_html(full_html=False, include_plotlyjs=False, validate=False, config={'responsive': True})}
                     
                     <div class="score-details">
                         <h3>📋 Detailed Scores:</h3>
@@ -427,7 +519,7 @@ def create_simple_visualization(embeddings_data: List[Dict[str, Any]], output_di
         version_manager = VersionManager(output_dir)
         output_file = version_manager.get_versioned_path("embedding_analysis_2d", '.html')
         
-        fig.write_html(output_file)
+        fig.write_html(output_file, include_plotlyjs='cdn')
         return str(output_file)
         
     except Exception as e:
@@ -169,3 +169,42 @@ def test_config_empty_file_uses_defaults(tmp_path):
     assert isinstance(config.scraping, ScrapingConfig)
     assert isinstance(config.embedding, EmbeddingConfig)
     assert isinstance(config.visualization, VisualizationConfig)
+
+
+def test_config_load_is_memoized_per_mtime(tmp_path):
+    """Repeated loads of an unchanged file reuse the parse but not the object."""
+    config_file = tmp_path / "config.yaml"
+    with open(config_file, 'w') as f:
+        yaml.dump({'output_dir': 'first'}, f)
+
+    first = Config.load_from_file(str(config_file), interactive=False)
+    second = Config.load_from_file(str(config_file), interactive=False)
+
+    assert first == second
+    # Each caller owns its instance: mutating one load must not leak into
+    # later loads served from the memo
+    assert first is not second
+    first.output_dir = 'mutated'
+    third = Config.load_from_file(str(config_file), interactive=False)
+    assert third.output_dir == 'first'
+
+
+def test_config_load_memo_invalidated_on_edit(tmp_path):
+    """Editing the file (new mtime) must bypass the memoized parse."""
+    import os
+
+    config_file = tmp_path / "config.yaml"
+    with open(config_file, 'w') as f:
+        yaml.dump({'output_dir': 'first'}, f)
+    before = Config.load_from_file(str(config_file), interactive=False)
+
+    with open(config_file, 'w') as f:
+        yaml.dump({'output_dir': 'second'}, f)
+    # Guarantee a distinct st_mtime_ns even on coarse-grained filesystems
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    after = Config.load_from_file(str(config_file), interactive=False)
+
+    assert before.output_dir == 'first'
+    assert after.output_dir == 'second'
@@ -0,0 +1,63 @@
+"""Tests for the on-disk embedding cache."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(PROJECT_SRC) not in sys.path:
+    sys.path.insert(0, str(PROJECT_SRC))
+
+from passage_embed.core.embed_cache import DiskEmbeddingCache
+
+
+def test_cache_miss_returns_none(tmp_path):
+    cache = DiskEmbeddingCache(str(tmp_path), 'test-model', 768)
+
+    assert cache.get('document', 'never stored') is None
+
+
+def test_cache_put_get_round_trip(tmp_path):
+    cache = DiskEmbeddingCache(str(tmp_path), 'test-model', 768)
+    embedding = np.arange(8, dtype=np.float32)
+
+    cache.put('document', 'some text', embedding)
+    restored = cache.get('document', 'some text')
+
+    np.testing.assert_array_equal(restored, embedding)
+
+
+def test_cache_separates_kinds(tmp_path):
+    # Asymmetric models embed the same text differently per kind, so a
+    # document entry must not satisfy a query lookup
+    cache = DiskEmbeddingCache(str(tmp_path), 'test-model', 768)
+    cache.put('document', 'same text', np.ones(4, dtype=np.float32))
+
+    assert cache.get('query', 'same text') is None
+
+
+def test_cache_keys_include_model_and_dim(tmp_path):
+    cache_a = DiskEmbeddingCache(str(tmp_path), 'model-a', 768)
+    cache_b = DiskEmbeddingCache(str(tmp_path), 'model-b', 768)
+    cache_c = DiskEmbeddingCache(str(tmp_path), 'model-a', 256)
+    cache_a.put('document', 'text', np.ones(4, dtype=np.float32))
+
+    assert cache_b.get('document', 'text') is None
+    assert cache_c.get('document', 'text') is None
+
+
+def test_unreadable_entry_treated_as_miss(tmp_path):
+    cache = DiskEmbeddingCache(str(tmp_path), 'test-model', 768)
+    cache.put('document', 'text', np.ones(4, dtype=np.float32))
+    entry = cache._entry_path('document', 'text')
+    entry.write_bytes(b'not an npy file')
+
+    assert cache.get('document', 'text') is None
+
+
+def test_put_leaves_no_temp_files_behind(tmp_path):
+    cache = DiskEmbeddingCache(str(tmp_path), 'test-model', 768)
+    cache.put('document', 'text', np.ones(4, dtype=np.float32))
+
+    assert list(tmp_path.glob('*.tmp')) == []
@@ -9,6 +9,7 @@ PROJECT_SRC = Path(__file__).resolve().parents[1] / "src"
 if str(PROJECT_SRC) not in sys.path:
     sys.path.insert(0, str(PROJECT_SRC))
 
+from passage_embed.analysis import embeddings
 from passage_embed.analysis.embeddings import EmbeddingGenerator
 from passage_embed.cli import DEFAULT_MODEL_NAME, resolve_model_name
 
@@ -57,6 +58,7 @@ def patch_sentence_transformer(monkeypatch):
     """Replace SentenceTransformer with a deterministic fake."""
 
     FakeSentenceTransformer.instances.clear()
+    embeddings._MODEL_CACHE.clear()
     monkeypatch.setattr(
         'passage_embed.analysis.embeddings.SentenceTransformer',
         FakeSentenceTransformer,
@@ -74,6 +76,7 @@ def patch_sentence_transformer(monkeypatch):
         else:
             sys.modules.pop('torch', None)
         FakeSentenceTransformer.instances.clear()
+        embeddings._MODEL_CACHE.clear()
 
 
 def test_resolve_model_name_presets():
@@ -119,7 +122,8 @@ def test_process_json_uses_document_encoding_for_gemma():
     )
 
     fake_model = FakeSentenceTransformer.instances[-1]
-    assert len(fake_model.encode_document_calls) == 2
+    assert len(fake_model.encode_document_calls) == 1
+    assert sorted(fake_model.encode_document_calls[0]) == ['Example paragraph.', 'Sample heading']
     assert len(fake_model.encode_calls) == 0
     assert embeddings_data[0]['embedding'].shape == (768,)
     assert mean_embeddings['client'].shape == (768,)
@@ -141,3 +145,91 @@ def test_generate_embeddings_truncates_documents():
     row_norms = np.linalg.norm(embeddings, axis=1)
     assert np.allclose(row_norms, 1.0)
 
+
+def test_save_and_load_embeddings_data_round_trip(tmp_path):
+    generator = EmbeddingGenerator(model_name='google/embeddinggemma-300m', embedding_dim=768)
+    json_data = {
+        'client': [
+            {'type': 'p', 'value': 'Example paragraph.', 'source': 'client'},
+            {'type': 'h1', 'value': 'Sample heading', 'source': 'client'},
+        ]
+    }
+    embeddings_data, _ = generator.process_json_data(json_data, {'client': 'circle'}, {'client': 8})
+
+    base_path = str(tmp_path / 'run')
+    npy_path, meta_path = embeddings.save_embeddings_data(embeddings_data, base_path)
+    assert npy_path.exists()
+    assert meta_path.exists()
+
+    loaded = embeddings.load_embeddings_data(base_path)
+    assert len(loaded) == len(embeddings_data)
+    for original, restored in zip(embeddings_data, loaded):
+        assert restored['label'] == original['label']
+        assert restored['type'] == original['type']
+        assert restored['value'] == original['value']
+        assert restored['embedding'].dtype == np.float32
+        np.testing.assert_allclose(restored['embedding'], original['embedding'])
+
+
+def test_load_embeddings_data_without_mmap(tmp_path):
+    rows = [
+        {'embedding': np.arange(4, dtype=np.float32), 'label': 'a', 'type': 'h1', 'value': 'x'},
+        {'embedding': np.arange(4, dtype=np.float32) + 1, 'label': 'b', 'type': 'h2', 'value': 'y'},
+    ]
+    base_path = str(tmp_path / 'run')
+    embeddings.save_embeddings_data(rows, base_path)
+
+    loaded = embeddings.load_embeddings_data(base_path, mmap=False)
+    assert [row['label'] for row in loaded] == ['a', 'b']
+    np.testing.assert_allclose(loaded[1]['embedding'], rows[1]['embedding'])
+
+def test_generate_embeddings_quantizes_to_int8():
+    generator = EmbeddingGenerator(model_name='all-MiniLM-L6-v2', precision='int8')
+    result = generator.generate_embeddings(['one text', 'two text'])
+
+    assert result.dtype == np.int8
+    assert result.shape == (2, 384)
+
+
+def test_generate_embeddings_casts_to_output_dtype():
+    generator = EmbeddingGenerator(model_name='all-MiniLM-L6-v2', output_dtype='float16')
+    result = generator.generate_embeddings(['one text'])
+
+    assert result.dtype == np.float16
+
+
+def test_invalid_precision_rejected():
+    from passage_embed.core.exceptions import EmbeddingError
+
+    with pytest.raises(EmbeddingError, match="precision must be one of"):
+        EmbeddingGenerator(model_name='all-MiniLM-L6-v2', precision='float64')
+
+
+def test_disk_cache_skips_reencoding_across_generators(tmp_path):
+    json_data = {
+        'client': [
+            {'type': 'p', 'value': 'Example paragraph.', 'source': 'client'},
+            {'type': 'h1', 'value': 'Sample heading', 'source': 'client'},
+        ]
+    }
+    first = EmbeddingGenerator(
+        model_name='google/embeddinggemma-300m', cache_dir=str(tmp_path)
+    )
+    first.process_json_data(json_data, {'client': 'circle'}, {'client': 8})
+    first_model = FakeSentenceTransformer.instances[-1]
+    assert len(first_model.encode_document_calls) == 1
+
+    # A fresh generator (and fresh model) over the same content must be
+    # served entirely from the disk cache
+    embeddings._MODEL_CACHE.clear()
+    second = EmbeddingGenerator(
+        model_name='google/embeddinggemma-300m', cache_dir=str(tmp_path)
+    )
+    embeddings_data, mean_embeddings = second.process_json_data(
+        json_data, {'client': 'circle'}, {'client': 8}
+    )
+    second_model = FakeSentenceTransformer.instances[-1]
+
+    assert second_model.encode_document_calls == []
+    assert len(embeddings_data) == 2
+    assert mean_embeddings['client'].shape == (768,)
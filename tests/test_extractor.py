@@ -0,0 +1,57 @@
+"""Tests for HTML extraction functionality."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(PROJECT_SRC) not in sys.path:
+    sys.path.insert(0, str(PROJECT_SRC))
+
+from passage_embed.analysis.extractor import HTMLExtractor
+from passage_embed.core.exceptions import FileError
+
+
+def test_save_and_load_extracted_data_round_trip(tmp_path):
+    extractor = HTMLExtractor(str(tmp_path))
+    data = {
+        'client': [
+            {'type': 'title', 'value': 'Café & Co', 'source': 'client'},
+            {'type': 'h1', 'value': 'Heading', 'source': 'client'},
+        ],
+        'competitor': [
+            {'type': 'meta description', 'value': 'A description', 'source': 'competitor'},
+        ],
+    }
+
+    json_path = extractor.save_extracted_data(data)
+    assert json_path.exists()
+
+    loaded = extractor.load_extracted_data(json_path)
+    assert loaded == data
+
+
+def test_load_extracted_data_missing_file_raises(tmp_path):
+    extractor = HTMLExtractor(str(tmp_path))
+
+    with pytest.raises(FileError):
+        extractor.load_extracted_data(tmp_path / 'does_not_exist.json')
+
+
+def test_extract_from_file_reads_utf8(tmp_path):
+    extractor = HTMLExtractor(str(tmp_path))
+    # The scraper persists UTF-8 text even when the page declared another
+    # charset; extraction must honor that instead of trusting the meta tag
+    html = (
+        '<html><head>'
+        '<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">'
+        '<title>Café</title>'
+        '</head></html>'
+    )
+    html_file = tmp_path / 'page.html'
+    html_file.write_text(html, encoding='utf-8')
+
+    extracted = extractor.extract_from_file(html_file, 'client')
+
+    assert {'type': 'title', 'value': 'Café', 'source': 'client'} in extracted
@@ -0,0 +1,66 @@
+"""Tests for output directory management utilities."""
+
+import sys
+from pathlib import Path
+
+PROJECT_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(PROJECT_SRC) not in sys.path:
+    sys.path.insert(0, str(PROJECT_SRC))
+
+from passage_embed.core.config import Config
+from passage_embed.utils.output_management import (
+    consolidate_scattered_outputs,
+    show_output_structure,
+)
+
+
+def test_consolidate_scattered_outputs_moves_files(tmp_path):
+    config = Config(output_dir=str(tmp_path / 'outputs'))
+    stray_dir = tmp_path / 'stray'
+    stray_dir.mkdir()
+    (stray_dir / 'result.html').write_text('<html></html>')
+    (stray_dir / 'data.json').write_text('{}')
+
+    moved = consolidate_scattered_outputs([stray_dir], config=config)
+
+    assert moved == 2
+    assert (tmp_path / 'outputs' / 'result.html').exists()
+    assert (tmp_path / 'outputs' / 'data.json').exists()
+    assert not (stray_dir / 'result.html').exists()
+
+
+def test_consolidate_scattered_outputs_skips_target_dir(tmp_path):
+    output_dir = tmp_path / 'outputs'
+    config = Config(output_dir=str(output_dir))
+    output_dir.mkdir()
+    (output_dir / 'keep.html').write_text('<html></html>')
+
+    moved = consolidate_scattered_outputs([output_dir], config=config)
+
+    assert moved == 0
+    assert (output_dir / 'keep.html').exists()
+
+
+def test_show_output_structure_prints_tree(tmp_path, capsys):
+    output_dir = tmp_path / 'outputs'
+    config = Config(output_dir=str(output_dir))
+    (output_dir / 'runs').mkdir(parents=True)
+    (output_dir / 'report.html').write_text('<html></html>')
+    (output_dir / 'runs' / 'data.json').write_text('{}')
+
+    show_output_structure(config=config)
+
+    captured = capsys.readouterr().out
+    assert f"{output_dir}/" in captured
+    assert 'report.html' in captured
+    assert 'runs/' in captured
+    assert 'data.json' in captured
+
+
+def test_show_output_structure_handles_missing_dir(tmp_path, capsys):
+    config = Config(output_dir=str(tmp_path / 'missing'))
+
+    show_output_structure(config=config)
+
+    captured = capsys.readouterr().out
+    assert 'does not exist' in captured
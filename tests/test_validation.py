@@ -0,0 +1,75 @@
+"""Tests for validation utilities."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(PROJECT_SRC) not in sys.path:
+    sys.path.insert(0, str(PROJECT_SRC))
+
+from passage_embed.core.exceptions import ValidationError
+from passage_embed.utils.validation import validate_queries, validate_url
+
+
+def test_validate_queries_strips_and_filters():
+    queries = validate_queries(' first query , ,second query,, third ')
+    assert queries == ['first query', 'second query', 'third']
+
+
+def test_validate_queries_empty_string_rejected():
+    with pytest.raises(ValidationError, match="Queries cannot be empty"):
+        validate_queries('')
+
+
+def test_validate_queries_only_separators_rejected():
+    with pytest.raises(ValidationError, match="No valid queries found"):
+        validate_queries(' , ,, ')
+
+
+def test_validate_queries_too_short_reports_position():
+    with pytest.raises(ValidationError, match="Query 2 too short: 'x'"):
+        validate_queries('valid query,x,another query')
+
+
+def test_validate_queries_too_long_rejected():
+    with pytest.raises(ValidationError, match="Query 1 too long"):
+        validate_queries('a' * 201)
+
+
+def test_validate_queries_count_error_precedes_length_error():
+    # 51 entries where one is too short: the maximum-count error must win,
+    # as it did before the single-pass rewrite
+    entries = [f'query {i}' for i in range(50)] + ['x']
+    with pytest.raises(ValidationError, match="Too many queries"):
+        validate_queries(','.join(entries))
+
+
+def test_validate_url_normalizes_missing_scheme():
+    assert validate_url('example.com/page') == 'https://example.com/page'
+
+
+@pytest.mark.parametrize('bad_url', ['?q=1', '#frag', 'https://?q=1', 'https:///path'])
+def test_validate_url_rejects_empty_netloc(bad_url):
+    with pytest.raises(ValidationError):
+        validate_url(bad_url)
+
+
+@pytest.mark.parametrize('bad_url', ['https://[invalid', 'https://exa]mple.com'])
+def test_validate_url_rejects_malformed_brackets(bad_url):
+    with pytest.raises(ValidationError):
+        validate_url(bad_url)
+
+
+def test_validate_url_accepts_ipv6_literal():
+    assert validate_url('https://[::1]/path') == 'https://[::1]/path'
+
+
+@pytest.mark.parametrize(
+    'bad_url',
+    ['?q=1', 'https://?q=1', 'https://[invalid', 'https://exa]mple.com'],
+)
+def test_validate_url_strict_agrees_with_fast_path(bad_url):
+    with pytest.raises(ValidationError):
+        validate_url(bad_url, strict=True)